@@ -2,14 +2,29 @@ import ast
 import os
 import sys
 import difflib
+import collections
+import hashlib
+import itertools
+import functools
+import concurrent.futures
+import multiprocessing
+import contextlib
+import glob
+import importlib.metadata
+import importlib.util
+import io
+import random
+import zlib
 import json
 import argparse
 import subprocess
+import shutil
 import logging
-from radon.metrics import mi_visit
-import autopep8 # For Python code formatting
+import mmap
+import re
 import time # Import the time module
-import matplotlib.pyplot as plt # Import matplotlib for graphing
+# autopep8 (Python formatting), Radon (Maintainability Index), matplotlib (graphs) and psutil (RAM usage)
+# are imported where they are used, so reviews that never reach those paths do not pay for loading them.
 
 # Try to import the resource module for memory usage (Unix-specific)
 try:
@@ -18,22 +33,141 @@ try:
 except ImportError:
     resource_available = False
 
-# Try to import the psutil module for memory usage (Cross-platform)
+# Check whether the psutil module is available for memory usage (Cross-platform); it is imported on first use
+psutil_available = importlib.util.find_spec("psutil") is not None
+
+# Try to import lizard for faster complexity analysis (Radon is used when it is missing)
+try:
+    import lizard
+    lizard_available = True
+except ImportError:
+    lizard_available = False
+
+# Try to import RapidFuzz (and NumPy, which its cdist needs) for native line similarity scoring (--fuzzy-scorer rapidfuzz)
+# (RapidFuzz first, so NumPy is not loaded for nothing when RapidFuzz is missing)
+try:
+    from rapidfuzz import fuzz, process as rapidfuzz_process
+    import numpy
+    rapidfuzz_available = True
+except ImportError:
+    rapidfuzz_available = False
+
+# Check whether Numba (and NumPy) are available to compile the MinHash signature kernel (pure Python is
+# used otherwise); they are imported, and the kernel compiled, on first use (see _minhash_kernel)
+numba_available = all(importlib.util.find_spec(name) is not None for name in ("numpy", "numba"))
+
+# Try to import orjson for faster report writing and tool-output parsing (stdlib json is used otherwise)
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Try to import pyahocorasick to match all fix-suggestion patterns in one pass (substring checks otherwise)
+try:
+    import ahocorasick
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
+
+# Try to import BLAKE3 for hashing files into tool-cache keys (hashlib's BLAKE2 is used otherwise)
+try:
+    import blake3
+    blake3_available = True
+except ImportError:
+    blake3_available = False
+
+# Try to import xxhash, whose XXH3 hash is faster still than BLAKE3 for tool-cache keys (which need no cryptographic strength)
 try:
-    import psutil
-    psutil_available = True
+    import xxhash
+    xxhash_available = True
 except ImportError:
-    psutil_available = False
+    xxhash_available = False
 
 # --- Constants ---
 # Threshold for detecting duplicate lines using SequenceMatcher
 SIMILARITY_THRESHOLD = 0.9
+# Character shingle width used to build MinHash signatures for near-duplicate lines
+SHINGLE_SIZE = 4
+# LSH banding: lines sharing any band of MINHASH_ROWS signature values become candidate pairs
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4
+# LSH buckets with at least this many lines are scored with a single RapidFuzz cdist call
+CDIST_MIN_BUCKET_SIZE = 16
+# Below this many distinct lines, pure Python MinHash beats loading the compiled Numba kernel
+NUMBA_MIN_LINES = 1000
+# Files at least this large (in bytes) are decoded straight from a memory map instead of read into a bytes buffer first
+MMAP_MIN_SIZE = 256 * 1024
 # Encoding to use for reading and writing files
 ENCODING = "utf-8"
 # File to log errors from external tool execution
 ERROR_LOG_FILE = 'error_log.txt'
 # Maximum line length for code formatting (PEP 8 standard is 79, but 120 is common)
 MAX_LINE_LENGTH = 120
+# Directory holding the on-disk cache of linter/security tool output, and how long entries stay valid
+TOOL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "code-review")
+TOOL_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+# Configuration files the cached tools look up from the working directory and its parents, and the user-level
+# ones; the content of those found is part of the cache key
+TOOL_CONFIG_FILES = ("setup.cfg", "tox.ini", "pyproject.toml", ".flake8", ".bandit")
+TOOL_USER_CONFIG_FILES = (os.path.join(os.path.expanduser("~"), ".config", "flake8"),)
+# External tools still running after this many seconds are killed, so one hung tool cannot stall a review
+TOOL_TIMEOUT = 300
+
+# Language of each supported file extension (matched in lowercase)
+_LANGUAGES_BY_EXTENSION = {
+    '.py': 'python',
+    '.js': 'javascript', '.jsx': 'javascript',
+    '.html': 'html', '.htm': 'html',
+    '.java': 'java',
+    '.c': 'c',
+    '.cpp': 'cpp', '.cc': 'cpp', '.cxx': 'cpp', '.h': 'cpp', '.hpp': 'cpp',
+}
+
+# Universal hash family (a * x + b) mod p used to simulate MinHash permutations.
+# A fixed seed keeps signatures (and therefore duplicate counts) stable between runs.
+# With a < 2**31 and 32-bit shingle hashes, a * x + b always fits in an unsigned 64-bit integer,
+# so the compiled kernel below produces exactly the same signatures as the pure Python path.
+# Only the low 32 bits of each minimum are kept: LSH just compares signature values for equality,
+# and 32-bit values halve the signature matrix while adding a negligible chance of a false match.
+_MINHASH_VALUE_MASK = (1 << 32) - 1
+_MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = random.Random(0)
+_MINHASH_PERMUTATIONS = [
+    (_minhash_rng.randrange(1, 1 << 31), _minhash_rng.randrange(0, _MINHASH_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _minhash_kernel():
+    """
+    Imports Numba and builds the compiled MinHash kernel on first use.
+
+    Returns:
+        tuple: (kernel, coefficients_a, coefficients_b), the kernel taking the concatenated shingle
+            hashes, the line offsets, both coefficient arrays and the prime.
+    """
+    import numpy
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def kernel(hashes, offsets, coefficients_a, coefficients_b, prime):
+        """Computes one MinHash signature row per line from the concatenated shingle hashes of all lines."""
+        signatures = numpy.empty((offsets.size - 1, coefficients_a.size), dtype=numpy.uint32)
+        for line in prange(offsets.size - 1):
+            for k in range(coefficients_a.size):
+                lowest = prime
+                for position in range(offsets[line], offsets[line + 1]):
+                    value = (coefficients_a[k] * hashes[position] + coefficients_b[k]) % prime
+                    if value < lowest:
+                        lowest = value
+                signatures[line, k] = lowest & _MINHASH_VALUE_MASK
+        return signatures
+
+    coefficients_a = numpy.array([a for a, _ in _MINHASH_PERMUTATIONS], dtype=numpy.uint64)
+    coefficients_b = numpy.array([b for _, b in _MINHASH_PERMUTATIONS], dtype=numpy.uint64)
+    return kernel, coefficients_a, coefficients_b
 
 # --- External Tool Paths/Commands (Placeholders) ---
 # IMPORTANT: Replace these with the actual paths or commands for your system.
@@ -44,6 +178,228 @@ PMD_BIN_PATH = "/path/to/your/pmd-bin-6.55.0/bin/run.sh" # e.g., path to PMD run
 PMD_RULESET = "rulesets/java/quickstart.xml" # Example PMD ruleset
 GOOGLE_JAVA_FORMAT_JAR = "/path/to/your/tools/google-java-format-1.17.0-all-deps.jar" # e.g., path to Google Java Format JAR
 
+# Resolve the tools found on PATH once at startup (None when a tool is not installed), so a missing
+# tool is reported without forking, and an installed one is exec'd without another PATH search.
+_TOOL_PATHS = {name: shutil.which(name) for name in (
+    "pylint", "mypy", "flake8", "bandit", "pip-audit", "python", "eslint", "prettier", "prettierd",
+    "htmlhint", "java", "gcc", "g++", "cppcheck", "clang-format",
+)}
+# eslint_d keeps ESLint loaded in a background server and takes the same arguments, so it replaces
+# eslint when installed. (prettierd has a different CLI, see format_javascript_code.)
+_TOOL_PATHS["eslint"] = shutil.which("eslint_d") or _TOOL_PATHS["eslint"]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter either way.
+# json_dumps returns encoded bytes, so orjson's output is written to binary files without a decode.
+if orjson_available:
+    json_loads = orjson.loads
+    def json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    json_loads = json.loads
+    def json_dumps(data):
+        return json.dumps(data, indent=4).encode(ENCODING)
+
+# --- Fix Suggestions ---
+# (patterns, suggestion) pairs: the suggestion is given when the error output contains any of the patterns.
+# Suggestions may refer to the reviewed file as {filepath}.
+_FIX_SUGGESTIONS = [
+    (("TypeError",), "🔹 Fix TypeError: Ensure variables have matching data types or perform explicit type casting."),
+    (("IndexError",), "🔹 Fix IndexError: Check list/sequence boundaries before accessing elements. Use len() or in operator."),
+    (("ValueError",), "🔹 Fix ValueError: Validate input values before attempting conversions or operations that expect specific formats."),
+    (("UnicodeEncodeError", "UnicodeDecodeError"), "🔹 Fix Unicode Error: Ensure consistent encoding (e.g., UTF-8) when reading/writing files or handling strings. Check sys.stdout.reconfigure(encoding='utf-8')."),
+    (("NameError",), "🔹 Fix NameError: Ensure all variables and functions are defined and spelled correctly before use. Check variable scope."),
+    (("FileNotFoundError",), "🔹 Fix FileNotFoundError: Verify the file path is correct and the file exists at: {filepath}. Check file permissions."),
+    (("ImportError", "ModuleNotFoundError"), "🔹 Fix ImportError: Ensure required libraries are installed (pip install library_name) and that import paths are correct."),
+    (("SyntaxError",), "🔹 Fix SyntaxError: Review the indicated line for grammatical errors in the code structure (e.g., missing colons, unmatched parentheses)."),
+    (("IndentationError",), "🔹 Fix IndentationError: Ensure consistent and correct indentation (spaces or tabs, but not both) for code blocks in Python."),
+    (("timed out",), "🔹 Address Timeout: The script might be in an infinite loop or performing a very long computation. Review loops and complex algorithms."),
+    (("can't multiply sequence by non-int of type 'float'",), "🔹 Fix TypeError: The can't multiply sequence by non-int of type 'float' error usually means you're trying to perform arithmetic with a list or other sequence type and a number. Ensure you are using numeric types where arithmetic is expected."),
+]
+
+# Aho-Corasick automaton over every pattern, mapping each one to its _FIX_SUGGESTIONS index
+_FIX_AUTOMATON = None
+if ahocorasick_available:
+    _FIX_AUTOMATON = ahocorasick.Automaton()
+    for _index, (_patterns, _) in enumerate(_FIX_SUGGESTIONS):
+        for _pattern in _patterns:
+            _FIX_AUTOMATON.add_word(_pattern, _index)
+    _FIX_AUTOMATON.make_automaton()
+
+# Without pyahocorasick, a single regex alternation of the escaped patterns scans the output once
+# instead of one substring search per pattern. (No pattern occurs inside another, so the regex's
+# non-overlapping matches find the same patterns as the automaton.)
+_FIX_PATTERN_INDEX = {pattern: index for index, (patterns, _) in enumerate(_FIX_SUGGESTIONS) for pattern in patterns}
+_FIX_REGEX = re.compile("|".join(map(re.escape, _FIX_PATTERN_INDEX)))
+
+# The path that prefixes a linter message: everything up to the first colon followed by the line number
+# or a space ("path:12:3: ...", "path: line 12, ...", "path: error: ..."), so a drive letter's colon is kept
+_MESSAGE_PATH = re.compile(r"(.+?):(?=[\d ])")
+
+# --- Memory Probe ---
+# The memory module is chosen once here instead of on every sample. resource.getrusage reports
+# ru_maxrss (peak RSS, kilobytes on Linux); psutil reports the current RSS in bytes.
+_psutil_process = None
+
+def _resource_memory_usage():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _psutil_memory_usage():
+    # psutil.Process() reads /proc when created, so one handle is kept per process
+    # (review workers are forked, hence the pid check)
+    global _psutil_process
+    if _psutil_process is None or _psutil_process.pid != os.getpid():
+        import psutil
+        _psutil_process = psutil.Process(os.getpid())
+    return _psutil_process.memory_info().rss
+
+if resource_available:
+    MEMORY_MODULE, _memory_probe = 'resource', _resource_memory_usage
+elif psutil_available:
+    MEMORY_MODULE, _memory_probe = 'psutil', _psutil_memory_usage
+else:
+    MEMORY_MODULE, _memory_probe = None, None
+
+
+def _cached_tool(tool):
+    """
+    Caches a tool runner's output on disk, keyed by the content of the files it checks.
+
+    Only tools whose output depends on nothing but the checked files (Flake8, Bandit) are cached:
+    Pylint and MyPy also follow the files' imports, so their output changes with modules the key
+    does not cover (MyPy keeps its own incremental .mypy_cache instead).
+
+    The key also covers the tool's resolved executable and installed version (so upgrading the
+    tool invalidates its entries), this script's own mtime (so changes to how output is rendered do),
+    the working directory and the paths as given (the output refers to the files by those paths)
+    and the tool configuration files found (TOOL_CONFIG_FILES, TOOL_USER_CONFIG_FILES).
+    Failed runs ("❌ ..." results) are never stored, and expired entries are deleted.
+
+    Args:
+        tool (str): Name of the tool, as in _TOOL_PATHS.
+    """
+    def decorator(runner):
+        @functools.wraps(runner)
+        def wrapper(self, *args, **kwargs):
+            executable = _TOOL_PATHS.get(tool)
+            if not self.use_cache or executable is None:
+                return runner(self, *args, **kwargs)
+            paths = (args[0] if args else kwargs.get("paths")) or [self.filepath]
+            cache_path = None
+            try:
+                cache_path = _tool_cache_path(tool, executable, paths)
+                if time.time() - os.stat(cache_path).st_mtime < TOOL_CACHE_TTL:
+                    with open(cache_path, "rb") as f:
+                        return json_loads(f.read())["output"]
+            except (OSError, ValueError, KeyError):
+                # No usable entry (or the files could not be hashed); run the tool
+                pass
+
+            output = runner(self, *args, **kwargs)
+            if cache_path and not (isinstance(output, str) and output.startswith("❌")):
+                try:
+                    os.makedirs(TOOL_CACHE_DIR, exist_ok=True)
+                    _prune_tool_cache()
+                    # Write to a private temporary file, then rename it into place atomically, so
+                    # concurrent reviews never read a partially written entry
+                    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(temp_path, "wb") as f:
+                        f.write(json_dumps({"tool": tool, "output": output}))
+                    os.replace(temp_path, cache_path)
+                except OSError as e:
+                    logging.error(f"Could not write tool cache entry {cache_path}: {e}")
+            return output
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_language(filepath):
+    """Looks up the language of a file path's extension (see CodeReviewSystem.detect_language)."""
+    # Use lowercase extension for consistent matching; 'unknown' instead of None
+    return _LANGUAGES_BY_EXTENSION.get(os.path.splitext(filepath)[1].lower(), 'unknown')
+
+
+def _normalized_path(path):
+    """Returns the absolute, normalized form of a path, for comparing paths spelled differently."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _tool_cache_path(tool, executable, paths):
+    """Returns the cache file for running the tool at `executable` on the current content of `paths`."""
+    if xxhash_available:
+        hasher = xxhash.xxh3_128()
+    elif blake3_available:
+        hasher = blake3.blake3()
+    else:
+        hasher = hashlib.blake2b(digest_size=32)
+    cwd = os.getcwd()
+    hasher.update(f"{tool}\0{executable}\0{_tool_version(tool)}\0"
+                  f"{os.stat(__file__).st_mtime_ns}\0{cwd}\0".encode(ENCODING))
+    # Tools look for their project configuration from the working directory upwards
+    config_paths = []
+    directory = cwd
+    while True:
+        config_paths.extend(os.path.join(directory, name) for name in TOOL_CONFIG_FILES)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    for config_path in [*config_paths, *TOOL_USER_CONFIG_FILES]:
+        if os.path.isfile(config_path):
+            hasher.update(f"{config_path}\0".encode(ENCODING))
+            _hash_file(hasher, config_path)
+    for path in paths:
+        hasher.update(f"\0{path}\0{os.path.abspath(path)}\0".encode(ENCODING))
+        _hash_file(hasher, path)
+    return os.path.join(TOOL_CACHE_DIR, f"{hasher.hexdigest()}_{tool}.json")
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_version(tool):
+    """Returns the installed version of a tool, resolved once per process."""
+    # The executable on PATH is often a wrapper (e.g. a pyenv shim) whose mtime never changes,
+    # so the version comes from the installed package instead
+    try:
+        return importlib.metadata.version(tool)
+    except importlib.metadata.PackageNotFoundError:
+        # Installed outside this interpreter (e.g. with pipx): ask the tool itself
+        try:
+            return subprocess.run([_TOOL_PATHS[tool], "--version"], stdin=subprocess.DEVNULL,
+                                  capture_output=True, timeout=TOOL_TIMEOUT).stdout.decode(ENCODING, errors="replace")
+        except (OSError, subprocess.SubprocessError) as e:
+            logging.error(f"Could not determine the {tool} version: {e}")
+            return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _prune_tool_cache():
+    """Deletes the tool-cache entries older than TOOL_CACHE_TTL, once per process."""
+    # Entries for files that have since changed are never looked up again, so without this
+    # the cache directory would only ever grow
+    now = time.time()
+    with os.scandir(TOOL_CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if now - entry.stat().st_mtime >= TOOL_CACHE_TTL:
+                    os.remove(entry.path)
+            except OSError:
+                # Already removed by a concurrent review
+                pass
+
+
+def _hash_file(hasher, path):
+    """Feeds a file's size and content to hasher."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # The size delimits the content from whatever is hashed next
+        hasher.update(f"{size}\0".encode(ENCODING))
+        if size >= MMAP_MIN_SIZE:
+            # Hash large files straight from the page cache instead of copying them into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            hasher.update(f.read())
+
 # --- Configure Logging ---
 # Set up basic logging to the error file
 logging.basicConfig(filename=ERROR_LOG_FILE, level=logging.ERROR,
@@ -57,44 +413,121 @@ sys.stdout.reconfigure(encoding='utf-8')
 class CodeReviewSystem:
     """Automated code review system for complexity, security, and error detection."""
 
-    def _init_(self, filepath):
+    # Fixed attribute layout: no per-instance __dict__ when many files are reviewed in one process
+    __slots__ = (
+        "filepath", "batch_results", "complexity_backend", "fuzzy_duplicates", "fuzzy_scorer", "use_cache", "execute",
+        "sample_memory_between_phases", "graphs", "original_code", "fixed_code", "memory_module_used",
+        "_source_cache", "_ast_cache",
+    )
+
+    def __init__(self, filepath, batch_results=None, complexity_backend='lizard', fuzzy_duplicates=False,
+                 fuzzy_scorer='difflib', use_cache=True, execute=False, sample_memory_between_phases=True,
+                 graphs=True):
         """
         Intializes the CodeReviewSystem with the file path to be reviewed.
 
         Args:
             filepath (str): Path to the file to be reviewed.
+            batch_results (dict): Optional tool output for this file collected by a batched
+                run over several files (see run_batch), reused instead of re-running those tools.
+            complexity_backend (str): 'lizard' (cyclomatic complexity, falls back to Radon when
+                lizard is not installed) or 'radon' (Maintainability Index).
+            fuzzy_duplicates (bool): Also count near-duplicate lines (MinHash/LSH + similarity
+                scoring) instead of exact duplicates only.
+            fuzzy_scorer (str): 'difflib' (SequenceMatcher ratio) or 'rapidfuzz' (RapidFuzz's Indel
+                ratio: faster, but never below difflib's, so it can count more near-duplicates;
+                falls back to difflib when RapidFuzz is not installed).
+            use_cache (bool): Reuse Flake8/Bandit output cached on disk (TOOL_CACHE_DIR)
+                for files whose content has not changed since an earlier run.
+            execute (bool): Detect runtime errors by running Python files instead of only
+                compiling them (syntax check).
+            sample_memory_between_phases (bool): Also sample RAM usage between the analysis
+                and report phases (the initial and final samples are always taken).
+            graphs (bool): Save the time and RAM usage graphs (PNG files next to the reviewed file).
         """
         self.filepath = filepath
+        self.batch_results = batch_results or {}
+        self.complexity_backend = complexity_backend
+        self.fuzzy_duplicates = fuzzy_duplicates
+        self.fuzzy_scorer = fuzzy_scorer
+        self.use_cache = use_cache
+        self.execute = execute
+        self.sample_memory_between_phases = sample_memory_between_phases
+        self.graphs = graphs
         # Store original and fixed code for diffing and reporting
         self.original_code = ""
         self.fixed_code = ""
-        # To store which memory module was used for reporting
-        self.memory_module_used = None
+        # To store which memory module was used for reporting (None once sampling fails)
+        self.memory_module_used = MEMORY_MODULE
+        # File contents keyed by path (validated against the file's stat signature)
+        self._source_cache = {}
+        # Parsed ASTs keyed by the source they were parsed from
+        self._ast_cache = {}
 
     def get_current_memory_usage(self):
-        """Gets the current process memory usage using available modules."""
-        if resource_available:
-            try:
-                # resource.getrusage returns ru_maxrss in kilobytes on many Unix systems
-                self.memory_module_used = 'resource'
-                return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-            except Exception as e:
-                logging.error(f"Error getting RAM usage with resource: {e}")
-                self.memory_module_used = None
-                return "N/A (Error collecting data with resource)"
-        elif psutil_available:
-            try:
-                # psutil.Process().memory_info().rss is Resident Set Size (non-paged memory) in bytes
-                process = psutil.Process(os.getpid())
-                self.memory_module_used = 'psutil'
-                return process.memory_info().rss # Returns bytes
-            except Exception as e:
-                logging.error(f"Error getting RAM usage with psutil: {e}")
-                self.memory_module_used = None
-                return "N/A (Error collecting data with psutil)"
-        else:
-            self.memory_module_used = None
+        """Gets the current process memory usage using the module chosen at import (see MEMORY_MODULE)."""
+        if _memory_probe is None:
             return "N/A (Neither resource nor psutil available)"
+        try:
+            return _memory_probe()
+        except Exception as e:
+            logging.error(f"Error getting RAM usage with {MEMORY_MODULE}: {e}")
+            self.memory_module_used = None
+            return f"N/A (Error collecting data with {MEMORY_MODULE})"
+
+    def _record_memory_usage(self, results, phase):
+        """Stores a RAM usage sample under ram_usage_<phase>, and the module that measured it under ram_usage_module."""
+        # Fixed keys let the summary and graphs look the samples up directly
+        results[f"ram_usage_{phase}"] = self.get_current_memory_usage()
+        results["ram_usage_module"] = self.memory_module_used
+
+    def _read(self, filepath=None):
+        """
+        Reads a file through a cache so unchanged files are only read once.
+
+        Args:
+            filepath (str): Path to the file. Defaults to the file under review.
+
+        Returns:
+            str: The content of the file, or an empty string if an error occurs.
+        """
+        filepath = filepath or self.filepath
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            # Let read_file report the missing/unreadable file
+            return self.read_file(filepath)
+
+        # In-place formatters rewrite the file, which changes its mtime and usually its size
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._source_cache.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        code = self.read_file(filepath)
+        self._source_cache[filepath] = (key, code)
+        return code
+
+    def _write(self, filepath, data):
+        """
+        Writes a formatter's output to a file and caches its text, so the next _read does not read the file back.
+
+        Args:
+            filepath (str): Path to the file.
+            data (bytes): The encoded content, written as-is so the formatter's line endings are kept.
+        """
+        with open(filepath, "wb") as f:
+            f.write(data)
+        stat = os.stat(filepath)
+        self._source_cache[filepath] = ((stat.st_mtime_ns, stat.st_size), self._decode_output(data))
+
+    def _tree(self, code):
+        """Returns the AST for the code, parsing each distinct source only once."""
+        # The source string is its own key: str caches its hash, so a lookup costs one equality
+        # check (an identity check for the same object) instead of re-encoding and re-hashing it
+        tree = self._ast_cache.get(code)
+        if tree is None:
+            tree = self._ast_cache[code] = ast.parse(code)
+        return tree
 
     def run_review(self):
         """Run all analysis checks and generate reports."""
@@ -102,15 +535,11 @@ class CodeReviewSystem:
         start_time = time.time() # Record start time
 
         # Record initial RAM usage
-        initial_ram_usage = self.get_current_memory_usage()
-        if self.memory_module_used:
-             results[f"ram_usage_initial ({self.memory_module_used})"] = initial_ram_usage
-        else:
-             results["ram_usage_initial"] = initial_ram_usage
+        self._record_memory_usage(results, "initial")
 
-
-        # Read the file content once at the beginning
-        self.original_code = self.read_file(self.filepath)
+        # Read the file content once at the beginning (a batched run reads it before formatting in place)
+        if not self.original_code:
+            self.original_code = self._read()
 
         # If file reading failed, report and exit
         if not self.original_code:
@@ -126,19 +555,19 @@ class CodeReviewSystem:
              # Pass both original and fixed code to analyze_python for complexity comparison
              results.update(self.analyze_python(self.original_code, self.fixed_code))
         elif language == 'javascript':
-             # For JS, format in place and then re-read the file
-             results["formatting_status"] = self.format_javascript_code()
-             self.fixed_code = self.read_file(self.filepath) # Read the file again after formatting
+             # For JS, format in place (unless a batched run already did) and then get the formatted code
+             results["formatting_status"] = self._batched("formatting_status", self.format_javascript_code)
+             self.fixed_code = self._read() # Cached when the formatter wrote it, read again after a batched run
              results.update(self.analyze_javascript())
         elif language == 'html':
-             # For HTML, format in place and then re-read the file
-             results["formatting_status"] = self.format_html_code()
-             self.fixed_code = self.read_file(self.filepath) # Read the file again after formatting
+             # For HTML, format in place (unless a batched run already did) and then get the formatted code
+             results["formatting_status"] = self._batched("formatting_status", self.format_html_code)
+             self.fixed_code = self._read() # Cached when the formatter wrote it, read again after a batched run
              results.update(self.analyze_html())
         elif language == 'java':
-             # For Java, format in place and then re-read the file
-             results["formatting_status"] = self.format_java_code()
-             self.fixed_code = self.read_file(self.filepath) # Read the file again after formatting
+             # For Java, format the source through stdin, write it back if it changed and then get the formatted code
+             results["formatting_status"] = self._batched("formatting_status", self.format_java_code)
+             self.fixed_code = self._read() # Cached when the formatter wrote it, so not read again
              results.update(self.analyze_java())
         elif language == 'c':
              # For C, format and get the fixed code string
@@ -156,18 +585,17 @@ class CodeReviewSystem:
             self.fixed_code = self.original_code # No formatting applied
 
         analysis_fix_end_time = time.time() # Record time after analysis and fixing
-        results["time_analysis_fix"] = analysis_fix_end_time - start_time
-
-        # Record RAM usage after analysis and fixing
-        analysis_fix_ram_usage = self.get_current_memory_usage()
-        if self.memory_module_used:
-             results[f"ram_usage_analysis_fix ({self.memory_module_used})"] = analysis_fix_ram_usage
-        else:
-             results["ram_usage_analysis_fix"] = analysis_fix_ram_usage
+        # Tools batched over several files ran before this review; include this file's share of their time
+        results["time_analysis_fix"] = (analysis_fix_end_time - start_time
+                                        + self.batch_results.get("time_batched_tools", 0))
 
+        # Record RAM usage after analysis and fixing (optional, as it runs between the timed phases)
+        if self.sample_memory_between_phases:
+            self._record_memory_usage(results, "analysis_fix")
 
         # Add fix suggestions based on runtime errors (primarily for Python, but can be extended)
-        # Note: Runtime errors are still detected on the original file path.
+        # Note: By default runtime errors come from compiling the formatted (fixed) code; only with
+        # --execute are they detected by running the original file.
         results["Fix Suggestions"] = self.suggest_fixes(results.get("runtime_errors", ""))
 
         # Calculate report generation time and RAM usage before printing summary
@@ -178,14 +606,11 @@ class CodeReviewSystem:
         results["time_report_generation"] = report_end_time - report_start_time
 
         # Record RAM usage after report generation
-        report_generation_ram_usage = self.get_current_memory_usage()
-        if self.memory_module_used:
-             results[f"ram_usage_report_generation ({self.memory_module_used})"] = report_generation_ram_usage
-        else:
-             results["ram_usage_report_generation"] = report_generation_ram_usage
+        self._record_memory_usage(results, "report_generation")
 
         # Generate performance graphs
-        self.generate_performance_graphs(results)
+        if self.graphs:
+            self.generate_performance_graphs(results)
 
 
         # Now generate and print the summary with all metrics available
@@ -200,23 +625,9 @@ class CodeReviewSystem:
             filepath (str): Path to the file.
 
         Returns:
-            str: The detected language (e.g., 'python', 'javascript', 'html', 'java', 'c', 'cpp') or None if unknown.
+            str: The detected language (e.g., 'python', 'javascript', 'html', 'java', 'c', 'cpp') or 'unknown'.
         """
-        _, ext = os.path.splitext(filepath)
-        ext = ext.lower() # Use lowercase extension for consistent matching
-        if ext == '.py':
-            return 'python'
-        elif ext in ['.js', '.jsx']:
-            return 'javascript'
-        elif ext in ['.html', '.htm']:
-            return 'html'
-        elif ext == '.java':
-            return 'java'
-        elif ext == '.c':
-            return 'c'
-        elif ext in ['.cpp', '.cc', '.cxx', '.h', '.hpp']:
-            return 'cpp'
-        return 'unknown' # Return 'unknown' instead of None
+        return _detect_language(filepath)
 
     def read_file(self, filepath):
         """
@@ -229,8 +640,19 @@ class CodeReviewSystem:
             str: The content of the file, or an empty string if an error occurs.
         """
         try:
-            with open(filepath, "r", encoding=ENCODING) as f:
-                return f.read()
+            with open(filepath, "rb") as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                    # Decode straight from the page cache: no intermediate bytes copy of a large file
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        code = str(mapped, ENCODING)
+                else:
+                    # Read the bytes in one call and decode them in one pass, instead of text mode's
+                    # chunk-by-chunk incremental decoding and newline translation
+                    code = f.read().decode(ENCODING)
+            # Match the newline translation of text mode
+            if "\r" in code:
+                code = code.replace("\r\n", "\n").replace("\r", "\n")
+            return code
         except FileNotFoundError:
             logging.error(f"File not found: {filepath}")
             print(f"❌ Error: File not found at {filepath}")
@@ -246,35 +668,43 @@ class CodeReviewSystem:
     def analyze_python(self, original_code, fixed_code):
         """Analyzes Python code for complexity, duplicates, security, errors, and style."""
         print("🔬 Analyzing Python code...")
-        results = {
+        # The checks are independent of each other, so they run concurrently (see _run_parallel)
+        tasks = {
             # Calculate complexity for both original and fixed code
-            "complexity_original": self.analyze_complexity(original_code),
-            "complexity_fixed": self.analyze_complexity(fixed_code),
-            # Duplicate detection using difflib on the potentially fixed code
-            "duplicates": self.detect_duplicates(fixed_code),
+            "complexity_original": functools.partial(self.analyze_complexity, original_code),
+            "complexity_fixed": functools.partial(self.analyze_complexity, fixed_code),
+            # Duplicate detection using hashing/MinHash on the potentially fixed code
+            "duplicates": functools.partial(self.detect_duplicates, fixed_code),
             # Security analysis using Bandit (runs on file path)
-            "security": self.analyze_security(),
+            "security": self.analyze_security,
             # Static analysis using Pylint (runs on file path)
-            "pylint": self.run_pylint(),
+            "pylint": self.run_pylint,
             # Type checking using MyPy (runs on file path)
-            "mypy": self.run_mypy(),
+            "mypy": self.run_mypy,
             # Style guide enforcement using Flake8 (runs on file path)
-            "flake8": self.run_flake8(),
+            "flake8": self.run_flake8,
             # Dependency vulnerability check using pip-audit (runs on environment)
-            "pip_audit": self.run_pip_audit(),
-            # Runtime error detection by executing the script (runs on file path)
-            "runtime_errors": self.detect_runtime_errors(),
+            "pip_audit": self.run_pip_audit,
+            # Runtime error detection: syntax check of the fixed code, or executing the script (file path)
+            "runtime_errors": functools.partial(self.detect_runtime_errors, fixed_code),
             # Magic number detection using AST on the potentially fixed code
-            "magic_numbers": self.detect_magic_numbers(fixed_code),
+            "magic_numbers": functools.partial(self.detect_magic_numbers, fixed_code),
         }
-        return results
+        if fixed_code != original_code:
+            return self._run_parallel(tasks)
+
+        # Formatting left the code unchanged, so its complexity is the original's: compute it once
+        del tasks["complexity_fixed"]
+        results = self._run_parallel(tasks)
+        return {"complexity_original": results["complexity_original"],
+                "complexity_fixed": results["complexity_original"], **results}
 
     def analyze_javascript(self):
         """Analyzes JavaScript code."""
         print("🔬 Analyzing JavaScript code...")
         results = {
             # Linting using ESLint (runs on file path)
-            "eslint": self.run_eslint(),
+            "eslint": self._batched("eslint", self.run_eslint),
             # Formatting status is added in run_review
         }
         return results
@@ -284,7 +714,7 @@ class CodeReviewSystem:
         print("🔬 Analyzing HTML code...")
         results = {
             # Linting using HTMLHint (runs on file path)
-            "htmlhint": self.run_htmlhint(),
+            "htmlhint": self._batched("htmlhint", self.run_htmlhint),
              # Formatting status is added in run_review
         }
         return results
@@ -292,44 +722,239 @@ class CodeReviewSystem:
     def analyze_java(self):
         """Analyzes Java code."""
         print("🔬 Analyzing Java code...")
-        results = {
+        tasks = {
             # Style checking using Checkstyle (runs on file path)
-            "checkstyle": self.run_checkstyle(),
+            "checkstyle": self.run_checkstyle,
             # Static analysis using PMD (runs on file path)
-            "pmd": self.run_pmd(),
+            "pmd": self.run_pmd,
              # Formatting status is added in run_review
         }
-        return results
+        return self._run_parallel(tasks)
 
     def analyze_c(self):
         """Analyzes C code."""
         print("🔬 Analyzing C code...")
-        results = {
+        tasks = {
             # Compiler warnings/syntax check using GCC (runs on file path)
-            "gcc": self.run_gcc_analysis(),
+            "gcc": self.run_gcc_analysis,
             # Static analysis using Cppcheck (runs on file path)
-            "cppcheck": self.run_cppcheck(),
+            "cppcheck": self.run_cppcheck,
              # Formatting status is added in run_review
         }
-        return results
+        return self._run_parallel(tasks)
 
     def analyze_cpp(self):
         """Analyzes C++ code."""
         print("🔬 Analyzing C++ code...")
-        results = {
+        tasks = {
             # Compiler warnings/syntax check using G++ (runs on file path)
-            "gpp": self.run_gpp_analysis(),
+            "gpp": self.run_gpp_analysis,
             # Static analysis using Cppcheck (runs on file path)
-            "cppcheck": self.run_cppcheck(),
+            "cppcheck": self.run_cppcheck,
              # Formatting status is added in run_review
         }
-        return results
+        return self._run_parallel(tasks)
+
+    def _run_parallel(self, tasks):
+        """
+        Runs independent analysis tasks concurrently.
+
+        Args:
+            tasks (dict): Maps result keys to callables taking no arguments.
+
+        Returns:
+            dict: The result of each task, in the same key order as tasks.
+        """
+        # Most tasks wait on an external tool (the GIL is released during subprocess.run),
+        # so threads overlap them and wall time becomes the slowest tool instead of the sum.
+        # Output already collected by a batched run is reused instead of running the tool again.
+        pending = {name: task for name, task in tasks.items() if name not in self.batch_results}
+        results = {}
+        if pending:
+            max_workers = min(len(pending), (os.cpu_count() or 1) * 2)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(task) for name, task in pending.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        return {name: results[name] if name in results else self.batch_results[name] for name in tasks}
+
+    def _batched(self, name, task):
+        """Returns the batched output stored under name, running task only if there is none."""
+        if name in self.batch_results:
+            return self.batch_results[name]
+        return task()
+
+    # --- Batch Methods ---
+
+    def run_batch(self, language, paths):
+        """
+        Runs the tools that accept several files once for a whole group of files.
+
+        Args:
+            language (str): The language shared by all the files.
+            paths (list): Paths of the files to review.
+
+        Returns:
+            dict: Maps each path to {result key: tool output}, to be passed as batch_results,
+                plus the file's share of the batch's run time under "time_batched_tools".
+        """
+        batch = {path: {} for path in paths}
+        start_time = time.time()
+        if language in ('javascript', 'html'):
+            # Prettier formats every file in place in a single run, so they share one status
+            # (before the linters start, so they check the formatted files)
+            status = self.format_javascript_code(paths)
+            for path in paths:
+                batch[path]["formatting_status"] = status
+
+        # (result key, runner, label) for each tool that takes a list of files
+        tools = {
+            'python': [("pylint", self.run_pylint, "Pylint"), ("mypy", self.run_mypy, "MyPy"),
+                       ("flake8", self.run_flake8, "Flake8")],
+            'javascript': [("eslint", self.run_eslint, "ESLint")],
+            'html': [("htmlhint", self.run_htmlhint, "HTMLHint")],
+            'c': [("cppcheck", self.run_cppcheck, "Cppcheck")],
+            'cpp': [("cppcheck", self.run_cppcheck, "Cppcheck")],
+        }.get(language, [])
+        # The tools are independent of each other, so they run concurrently, as in a single-file review
+        tasks = {name: functools.partial(runner, paths) for name, runner, _ in tools}
+        if language == 'python':
+            tasks["security"] = functools.partial(self.analyze_security, paths)
+            # pip-audit checks the environment, not the files, so one run serves every file
+            tasks["pip_audit"] = self.run_pip_audit
+        outputs = self._run_parallel(tasks)
+
+        for name, _, label in tools:
+            for path, output in self._split_tool_output(outputs[name], paths, label).items():
+                batch[path][name] = output
+        if language == 'python':
+            # Bandit reports JSON, so its report is split by each issue's file name instead
+            for path, report in self._split_security_report(outputs["security"], paths).items():
+                batch[path]["security"] = report
+            for path in paths:
+                batch[path]["pip_audit"] = outputs["pip_audit"]
+
+        # Each file's review adds an equal share of the batch's run time to its own analysis time
+        share = (time.time() - start_time) / len(paths)
+        for path in paths:
+            batch[path]["time_batched_tools"] = share
+        return batch
+
+    def _split_tool_output(self, output, paths, label):
+        """Splits the output of a tool run over several files into per-file output."""
+        # Execution failures (tool missing, crash, aborted run) are not tied to a file, so every file reports them
+        if output.startswith("❌"):
+            return {path: output for path in paths}
+
+        # Tools prefix each message with the path, as given, normalized (Pylint) or made absolute (ESLint),
+        # so both sides are compared as normalized absolute paths. Each line's prefix is parsed once
+        # and looked up in a dict, instead of being tested against every path.
+        owners = {_normalized_path(path): path for path in paths}
+        lines = {path: [] for path in paths}
+        resolved = {}
+        path = None
+        for line in output.splitlines():
+            # Indented lines (e.g. the source and caret lines under a Cppcheck message) continue the
+            # previous message, so they go to the same file
+            if not line[:1].isspace():
+                match = _MESSAGE_PATH.match(line)
+                if match:
+                    prefix = match.group(1)
+                    if prefix not in resolved:
+                        resolved[prefix] = owners.get(_normalized_path(prefix))
+                    path = resolved[prefix]
+                else:
+                    # Other unprefixed lines (summaries such as MyPy's "Found 2 errors") belong to no file
+                    path = None
+            if path is not None:
+                lines[path].append(line)
+        return {path: "\n".join(found) if found else f"✅ {label}: No issues found."
+                for path, found in lines.items()}
+
+    def _aborted_output(self, label, output):
+        """Reports the output of a tool run that could not check the files as an execution failure."""
+        # The "❌" prefix makes batched runs give the output to every file (see _split_tool_output)
+        # instead of a clean result, and keeps it out of the tool cache
+        logging.error(f"{label} could not check the file(s): {output}")
+        return f"❌ {label} could not check the file(s):\n{output}"
+
+    def _split_security_report(self, report, paths):
+        """Splits a Bandit JSON report over several files into one report per file."""
+        # Execution failures ("❌ ..." strings) are not tied to a file, so every file reports them
+        if not isinstance(report, dict):
+            return {path: report for path in paths}
+
+        # Bandit names files after its command line, but with a "./" prepended to relative paths,
+        # so both sides are compared as normalized absolute paths
+        owners = {_normalized_path(path): path for path in paths}
+        split = {path: {**report, "errors": [], "results": [], "metrics": {}} for path in paths}
+        for key in ("errors", "results"):
+            for item in report.get(key, []):
+                path = owners.get(_normalized_path(item.get("filename", "")))
+                if path is not None:
+                    split[path][key].append(item)
+        for filename, metrics in report.get("metrics", {}).items():
+            path = owners.get(_normalized_path(filename))
+            if path is not None:
+                # The file's own metrics are also its totals
+                split[path]["metrics"] = {filename: metrics, "_totals": metrics}
+        return split
+
+    def _run_tool(self, command, input=None, timeout=TOOL_TIMEOUT, decode=True):
+        """
+        Runs an external tool and collects its output.
+
+        Args:
+            command (list): The command and its arguments.
+            input (str or bytes): Optional text (encoded here) or raw bytes to send to the tool's stdin.
+            timeout (float): Number of seconds after which the tool is killed (None for no limit).
+            decode (bool): Decode stdout and stderr to str; False returns the raw bytes
+                (e.g. for JSON output, which the JSON parsers read straight from bytes).
+
+        Returns:
+            tuple: (returncode, stdout, stderr) of the finished tool.
+
+        Raises:
+            FileNotFoundError: If the tool is not installed.
+            subprocess.TimeoutExpired: If the tool ran longer than timeout.
+        """
+        if command[0] in _TOOL_PATHS:
+            executable = _TOOL_PATHS[command[0]]
+            if executable is None:
+                # Same error Popen would raise, without paying for the failed fork/exec
+                raise FileNotFoundError(f"{command[0]} is not installed or not in PATH")
+            command = [executable, *command[1:]]
+
+        # stdin is closed when there is no input, so a tool that waits for input cannot stall the review.
+        # communicate() drains stdout and stderr concurrently, so a tool filling one pipe never blocks.
+        stdin = subprocess.PIPE if input is not None else subprocess.DEVNULL
+        if isinstance(input, str):
+            input = input.encode(ENCODING)
+        # The pipes stay binary and each output is decoded once when the tool has finished,
+        # instead of incrementally through text-mode wrappers
+        with subprocess.Popen(command, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+            try:
+                stdout, stderr = process.communicate(input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        if not decode:
+            return process.returncode, stdout, stderr
+        return process.returncode, self._decode_output(stdout), self._decode_output(stderr)
+
+    def _decode_output(self, data):
+        """Decodes a tool's output, translating newlines as text mode would."""
+        text = data.decode(ENCODING, errors="replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     # --- Formatting Methods ---
 
     def format_python_code(self, code):
         """Apply basic fixes and use autopep8 for Python formatting."""
         try:
+            import autopep8
             # Use autopep8 to fix code style issues based on PEP 8
             formatted_code = autopep8.fix_code(code, options={'max_line_length': MAX_LINE_LENGTH})
             return formatted_code
@@ -338,19 +963,23 @@ class CodeReviewSystem:
             print(f"❌ Error during autopep8 formatting: {e}")
             return code # Return original code if formatting fails
 
-    def format_javascript_code(self):
-        """Formats JavaScript code using prettier (modifies file in place)."""
-        # Note: Prettier modifies the file in place.
+    def format_javascript_code(self, paths=None):
+        """Formats JavaScript code using prettier (modifies file(s) in place)."""
+        # Note: Prettier modifies the file in place. Several paths are formatted in one invocation.
+        paths = paths or [self.filepath]
+        if _TOOL_PATHS["prettierd"]:
+            return self._format_through_stdin(["prettierd"], paths)
+        if len(paths) == 1:
+            # A single file is piped through Prettier instead, so it is only rewritten (and never
+            # read back) when formatting changed it
+            return self._format_through_stdin(["prettier", "--stdin-filepath"], paths)
         try:
-            result = subprocess.run(
-                ["prettier", "--write", self.filepath],
-                capture_output=True, text=True, check=False
-            )
-            if result.returncode == 0:
+            returncode, _, stderr = self._run_tool(["prettier", "--write", *paths])
+            if returncode == 0:
                 return "✅ Prettier formatting applied."
             else:
-                logging.error(f"Prettier formatting issues or errors: {result.stderr}")
-                return f"⚠ Prettier formatting issues or errors:\n{result.stderr}"
+                logging.error(f"Prettier formatting issues or errors: {stderr}")
+                return f"⚠ Prettier formatting issues or errors:\n{stderr}"
         except FileNotFoundError:
             logging.error("Prettier is not installed or not in PATH.")
             return "❌ Prettier execution failed: not installed or not in PATH. (Install with: npm install -g prettier)"
@@ -358,26 +987,68 @@ class CodeReviewSystem:
             logging.error(f"Prettier execution failed: {e}")
             return f"❌ Prettier execution failed: {e}"
 
-    def format_html_code(self):
-        """Formats HTML code using Prettier (modifies file in place)."""
+    def _format_through_stdin(self, command, paths):
+        """
+        Formats files in place by piping each one through Prettier (or prettierd) via stdin.
+
+        Args:
+            command (list): The formatter command; each file's path is appended to it.
+            paths (list): Paths of the files to format.
+        """
+        # The formatter gets one file per call (source on stdin, the path selects the parser and
+        # config). prettierd only talks to its warm server instead of starting Node and Prettier.
+        # Both sides stay raw bytes, so a change of line endings (endOfLine) counts as a change
+        # and is written back exactly as the formatter produced it.
+        errors = []
+        try:
+            for path in paths:
+                with open(path, "rb") as f:
+                    source = f.read()
+                returncode, stdout, stderr = self._run_tool([*command, path], input=source, decode=False)
+                if returncode != 0:
+                    errors.append(f"{path}: {self._decode_output(stderr)}")
+                elif stdout != source:
+                    self._write(path, stdout)
+        except FileNotFoundError:
+            logging.error("Prettier is not installed or not in PATH.")
+            return "❌ Prettier execution failed: not installed or not in PATH. (Install with: npm install -g prettier)"
+        except Exception as e:
+            logging.error(f"{command[0]} execution failed: {e}")
+            return f"❌ Prettier execution failed: {e}"
+        if errors:
+            logging.error(f"Prettier formatting issues or errors: {errors}")
+            return "⚠ Prettier formatting issues or errors:\n" + "\n".join(errors)
+        return "✅ Prettier formatting applied."
+
+    def format_html_code(self, paths=None):
+        """Formats HTML code using Prettier (modifies file(s) in place)."""
         # Using Prettier for HTML as well, modifies file in place.
-        return self.format_javascript_code() # Prettier handles HTML
+        return self.format_javascript_code(paths) # Prettier handles HTML
 
     def format_java_code(self):
-        """Formats Java code using Google Java Format (modifies file in place)."""
-        # Note: Google Java Format modifies the file in place.
+        """Formats Java code using Google Java Format (writes the file only if formatting changed it)."""
+        # The source is piped through stdin ('-') and the result compared in memory, so an
+        # already-formatted file is not rewritten (its mtime, and so any cache keyed on it, stays
+        # valid). Both stay raw bytes, so the file's line endings are kept as the formatter emits
+        # them, as with --replace. Checkstyle/PMD then run on the file path.
         if not os.path.exists(GOOGLE_JAVA_FORMAT_JAR):
              logging.error(f"Google Java Format JAR not found at: {GOOGLE_JAVA_FORMAT_JAR}")
              return f"❌ Google Java Format execution failed: JAR not found at {GOOGLE_JAVA_FORMAT_JAR}. (Download from Maven Central)"
 
-        command = ["java", "-jar", GOOGLE_JAVA_FORMAT_JAR, "--replace", self.filepath]
+        command = ["java", "-jar", GOOGLE_JAVA_FORMAT_JAR, "-"]
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=False)
-            if result.returncode == 0:
+            with open(self.filepath, "rb") as f:
+                source = f.read()
+            returncode, stdout, stderr = self._run_tool(command, input=source, decode=False)
+            if returncode == 0:
+                 if stdout == source:
+                     return "✅ Google Java Format: code already formatted."
+                 self._write(self.filepath, stdout)
                  return "✅ Google Java Format applied."
             else:
-                 logging.error(f"Google Java Format issues or errors: {result.stderr}")
-                 return f"⚠ Google Java Format issues or errors:\n{result.stderr}"
+                 stderr = self._decode_output(stderr)
+                 logging.error(f"Google Java Format issues or errors: {stderr}")
+                 return f"⚠ Google Java Format issues or errors:\n{stderr}"
         except Exception as e:
             logging.error(f"Google Java Format execution failed: {e}")
             return f"❌ Google Java Format execution failed: {e}"
@@ -387,16 +1058,17 @@ class CodeReviewSystem:
         """Formats C code using clang-format (returns formatted code)."""
         # Using clang-format to output formatted code to stdout instead of modifying in place.
         try:
-            # Use '-' for stdin and stdout
-            result = subprocess.run(
-                ["clang-format", "-style=file", "-"], # -style=file looks for .clang-format file
-                capture_output=True, text=True, input=code, check=False
+            # Use '-' for stdin and stdout. -assume-filename makes clang-format pick the language from
+            # the file's extension, and look for the .clang-format file (-style=file) from its directory.
+            returncode, stdout, stderr = self._run_tool(
+                ["clang-format", "-style=file", f"-assume-filename={self.filepath}", "-"],
+                input=code
             )
-            if result.returncode == 0:
-                return result.stdout # Return the formatted code
+            if returncode == 0:
+                return stdout # Return the formatted code
             else:
-                logging.error(f"clang-format issues or errors: {result.stderr}")
-                print(f"⚠ clang-format issues or errors:\n{result.stderr}")
+                logging.error(f"clang-format issues or errors: {stderr}")
+                print(f"⚠ clang-format issues or errors:\n{stderr}")
                 return code # Return original code if formatting fails
         except FileNotFoundError:
             logging.error("clang-format not found. Please ensure it's installed and in your PATH.")
@@ -409,23 +1081,27 @@ class CodeReviewSystem:
 
     def format_cpp_code(self, code):
         """Formats C++ code using clang-format (returns formatted code)."""
-        # Using the same formatter for C++ as C, returning formatted code.
+        # Using the same formatter for C++ as C, returning formatted code (the file's extension,
+        # passed as -assume-filename, selects the C++ language mode).
         return self.format_c_code(code)
 
     # --- Static Analysis / Linting Methods ---
 
-    def run_eslint(self):
-        """Runs ESLint on the JavaScript file."""
+    def run_eslint(self, paths=None):
+        """Runs ESLint on the JavaScript file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         try:
             # --no-error-on-unmatched-pattern prevents errors if no files match pattern (though we pass a specific file)
             # --format compact provides a concise output
-            result = subprocess.run(
-                ["eslint", "--no-error-on-unmatched-pattern", "--format", "compact", self.filepath],
-                capture_output=True, text=True, check=False
+            returncode, stdout, stderr = self._run_tool(
+                ["eslint", "--no-error-on-unmatched-pattern", "--format", "compact", *paths]
             )
-            # ESLint returns 0 for no errors, non-zero for errors or issues.
+            # ESLint returns 0 for no errors, 1 for issues and 2 when a configuration problem or
+            # internal error stopped it from linting.
+            if returncode == 2:
+                return self._aborted_output("ESLint", stdout + stderr)
             # We capture stdout regardless of return code to show issues.
-            return result.stdout if result.stdout.strip() else "✅ ESLint: No issues found."
+            return stdout if stdout.strip() else "✅ ESLint: No issues found."
         except FileNotFoundError:
             logging.error("ESLint is not installed or not in PATH.")
             return "❌ ESLint execution failed: not installed or not in PATH. (Install with: npm install -g eslint)"
@@ -433,17 +1109,15 @@ class CodeReviewSystem:
             logging.error(f"ESLint execution failed: {e}")
             return f"❌ ESLint execution failed: {e}"
 
-    def run_htmlhint(self):
-        """Runs HTMLHint on the HTML file."""
+    def run_htmlhint(self, paths=None):
+        """Runs HTMLHint on the HTML file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         try:
             # --format compact provides a concise output
-            result = subprocess.run(
-                ["htmlhint", "--format", "compact", self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            _, stdout, _ = self._run_tool(["htmlhint", "--format", "compact", *paths])
             # HTMLHint returns 0 for no errors, non-zero for errors.
             # We capture stdout regardless of return code to show issues.
-            return result.stdout if result.stdout.strip() else "✅ HTMLHint: No issues found."
+            return stdout if stdout.strip() else "✅ HTMLHint: No issues found."
         except FileNotFoundError:
             logging.error("HTMLHint is not installed or not in PATH.")
             return "❌ HTMLHint execution failed: not installed or not in PATH. (Install with: npm install -g htmlhint)"
@@ -464,10 +1138,10 @@ class CodeReviewSystem:
         command.append(self.filepath)
 
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=False)
+            _, stdout, stderr = self._run_tool(command)
              # Checkstyle outputs issues to stdout or stderr depending on configuration/version.
              # We'll capture both and combine.
-            output = (result.stdout + result.stderr).strip()
+            output = (stdout + stderr).strip()
             return output if output else "✅ Checkstyle: No issues found."
         except Exception as e:
             logging.error(f"Checkstyle execution failed: {e}")
@@ -482,9 +1156,9 @@ class CodeReviewSystem:
 
         command = [PMD_BIN_PATH, "-d", self.filepath, "-f", "text", "-R", PMD_RULESET]
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=False)
+            _, stdout, _ = self._run_tool(command)
             # PMD outputs issues to stdout.
-            return result.stdout if result.stdout.strip() else "✅ PMD: No issues found."
+            return stdout if stdout.strip() else "✅ PMD: No issues found."
         except Exception as e:
             logging.error(f"PMD execution failed: {e}")
             return f"❌ PMD execution failed: {e}"
@@ -493,12 +1167,9 @@ class CodeReviewSystem:
         """Runs GCC analysis on the C file (syntax check and warnings)."""
         # -Wall and -Wextra enable extensive warnings. -fsyntax-only checks syntax without compiling.
         try:
-            result = subprocess.run(
-                ["gcc", "-Wall", "-Wextra", "-fsyntax-only", self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            _, _, stderr = self._run_tool(["gcc", "-Wall", "-Wextra", "-fsyntax-only", self.filepath])
             # GCC outputs warnings/errors to stderr.
-            return result.stderr if result.stderr.strip() else "✅ GCC: No syntax errors or warnings."
+            return stderr if stderr.strip() else "✅ GCC: No syntax errors or warnings."
         except FileNotFoundError:
             logging.error("GCC not found. Please ensure it's installed and in your PATH.")
             return "❌ GCC execution failed: not found. (Install GCC)"
@@ -510,12 +1181,9 @@ class CodeReviewSystem:
         """Runs G++ analysis on the C++ file (syntax check and warnings)."""
         # -Wall and -Wextra enable extensive warnings. -std=c++17 sets C++ standard. -fsyntax-only checks syntax.
         try:
-            result = subprocess.run(
-                ["g++", "-Wall", "-Wextra", "-std=c++17", "-fsyntax-only", self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            _, _, stderr = self._run_tool(["g++", "-Wall", "-Wextra", "-std=c++17", "-fsyntax-only", self.filepath])
             # G++ outputs warnings/errors to stderr.
-            return result.stderr if result.stderr.strip() else "✅ G++: No syntax errors or warnings."
+            return stderr if stderr.strip() else "✅ G++: No syntax errors or warnings."
         except FileNotFoundError:
             logging.error("G++ not found. Please ensure it's installed and in your PATH.")
             return "❌ G++ execution failed: not found. (Install G++)"
@@ -523,16 +1191,14 @@ class CodeReviewSystem:
             logging.error(f"G++ execution failed: {e}")
             return f"❌ G++ execution failed: {e}"
 
-    def run_cppcheck(self):
-        """Runs Cppcheck on the C/C++ file."""
+    def run_cppcheck(self, paths=None):
+        """Runs Cppcheck on the C/C++ file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         # --enable=all enables all checks.
         try:
-            result = subprocess.run(
-                ["cppcheck", "--enable=all", self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            _, _, stderr = self._run_tool(["cppcheck", "--enable=all", *paths])
             # Cppcheck outputs issues to stderr.
-            return result.stderr if result.stderr.strip() else "✅ Cppcheck: No issues found."
+            return stderr if stderr.strip() else "✅ Cppcheck: No issues found."
         except FileNotFoundError:
             logging.error("Cppcheck not found. Please ensure it's installed and in your PATH.")
             return "❌ Cppcheck execution failed: not found. (Install Cppcheck)"
@@ -540,16 +1206,27 @@ class CodeReviewSystem:
             logging.error(f"Cppcheck execution failed: {e}")
             return f"❌ Cppcheck execution failed: {e}"
 
-    def run_pylint(self):
-        """Runs Pylint on the Python file."""
+    def run_pylint(self, paths=None):
+        """Runs Pylint on the Python file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         try:
             # --max-line-length aligns with the constant
-            pylint_output = subprocess.run(
-                ["pylint", "--max-line-length", str(MAX_LINE_LENGTH), self.filepath],
-                capture_output=True, text=True, check=False
+            # --output-format=json gives one record per message (with its path) instead of a text report
+            _, stdout, stderr = self._run_tool(
+                ["pylint", "--max-line-length", str(MAX_LINE_LENGTH), "--output-format=json", *paths]
+            )
+            try:
+                messages = json_loads(stdout)
+            except json.JSONDecodeError:
+                # Pylint crashed or printed something else, so no file was checked; show it as-is
+                return self._aborted_output("Pylint", stdout + stderr)
+            if not messages:
+                return "✅ Pylint: No issues found."
+            # Render the messages like Pylint's own text format: path:line:column: id: message (symbol)
+            return "\n".join(
+                f"{m['path']}:{m['line']}:{m['column']}: {m['message-id']}: {m['message']} ({m['symbol']})"
+                for m in messages
             )
-            # Pylint outputs to stdout.
-            return pylint_output.stdout
         except FileNotFoundError:
             logging.error("Pylint is not installed or not in PATH.")
             return "❌ Pylint execution failed: not installed or not in PATH. (Install with: pip install pylint)"
@@ -557,16 +1234,17 @@ class CodeReviewSystem:
             logging.error(f"Pylint execution failed: {e}")
             return f"❌ Pylint execution failed: {e}"
 
-    def run_mypy(self):
-        """Runs MyPy on the Python file."""
+    def run_mypy(self, paths=None):
+        """Runs MyPy on the Python file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         try:
             # --ignore-missing-imports can be useful if not all dependencies are installed
-            mypy_output = subprocess.run(
-                ["mypy", "--ignore-missing-imports", self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            returncode, stdout, stderr = self._run_tool(["mypy", "--ignore-missing-imports", *paths])
+            # Exit code 2 means errors (e.g. a duplicate module name) prevented checking the files
+            if returncode == 2:
+                return self._aborted_output("MyPy", stdout + stderr)
             # MyPy outputs to stdout.
-            return mypy_output.stdout
+            return stdout
         except FileNotFoundError:
             logging.error("MyPy is not installed or not in PATH.")
             return "❌ MyPy execution failed: not installed or not in PATH. (Install with: pip install mypy)"
@@ -574,16 +1252,19 @@ class CodeReviewSystem:
             logging.error(f"MyPy execution failed: {e}")
             return f"❌ MyPy execution failed: {e}"
 
-    def run_flake8(self):
-        """Runs Flake8 on the Python file."""
+    @_cached_tool("flake8")
+    def run_flake8(self, paths=None):
+        """Runs Flake8 on the Python file (or on several files in one invocation)."""
+        paths = paths or [self.filepath]
         try:
             # --max-line-length aligns with the constant
-            flake8_output = subprocess.run(
-                ["flake8", "--max-line-length", str(MAX_LINE_LENGTH), self.filepath],
-                capture_output=True, text=True, check=False
-            )
+            returncode, stdout, stderr = self._run_tool(["flake8", "--max-line-length", str(MAX_LINE_LENGTH), *paths])
+            # Flake8 exits with 1 when it finds issues, but then it reports them; failing without
+            # reporting anything means it crashed (the traceback is on stderr)
+            if returncode != 0 and not stdout.strip():
+                return self._aborted_output("Flake8", stderr)
             # Flake8 outputs to stdout.
-            return flake8_output.stdout
+            return stdout
         except FileNotFoundError:
             logging.error("Flake8 is not installed or not in PATH.")
             return "❌ Flake8 execution failed: not installed or not in PATH. (Install with: pip install flake8)"
@@ -595,21 +1276,16 @@ class CodeReviewSystem:
         """Runs pip-audit to check for vulnerable dependencies."""
         # Note: This checks the environment's installed packages, not just those required by the file.
         try:
-            # check=True here because a non-zero exit code indicates vulnerabilities found, which is not an execution error.
-            # We want to capture the output in this case.
-            result = subprocess.run(
-                ["pip-audit"],
-                capture_output=True, text=True, check=True
-            )
+            returncode, stdout, stderr = self._run_tool(["pip-audit"])
+            # A non-zero exit code indicates vulnerabilities were found, which is not an execution error.
+            if returncode != 0:
+                logging.warning(f"Pip-audit found vulnerabilities: {stderr}")
+                return f"⚠ Pip-audit found vulnerabilities:\n{stdout + stderr}"
             # pip-audit outputs results to stdout.
-            return result.stdout if result.stdout.strip() else "✅ Pip-audit: No known vulnerabilities found in installed packages."
+            return stdout if stdout.strip() else "✅ Pip-audit: No known vulnerabilities found in installed packages."
         except FileNotFoundError:
             logging.error("Pip-audit is not installed or not in PATH.")
             return "❌ Pip-audit execution failed: not installed or not in PATH. (Install with: pip install pip-audit)"
-        except subprocess.CalledProcessError as e:
-             # This block catches non-zero exit codes from pip-audit when vulnerabilities are found.
-             logging.warning(f"Pip-audit found vulnerabilities: {e.stderr}")
-             return f"⚠ Pip-audit found vulnerabilities:\n{e.stdout + e.stderr}"
         except Exception as e:
             logging.error(f"Error running Pip-audit: {e}")
             return f"❌ Error running Pip-audit: {e}"
@@ -618,11 +1294,29 @@ class CodeReviewSystem:
 
     # analyze_complexity now returns a formatted string based on the result type
     def analyze_complexity(self, code):
-        """Analyzes the code complexity using Radon."""
+        """Analyzes the code complexity using lizard or Radon, depending on the selected backend."""
+        # Radon's metrics go through the stdlib tokenize module, which scales poorly on large
+        # files; lizard's own tokenizer computes cyclomatic complexity several times faster.
+        if self.complexity_backend == 'lizard' and lizard_available:
+            return self.analyze_complexity_lizard(code)
         try:
-            # mi_visit returns a list of Maintainability Index results when multi=True
-            # or a single float when multi=False (or perhaps in other cases)
-            maintainability_results = mi_visit(code, multi=True)
+            from radon.metrics import h_visit_ast, mi_compute
+            from radon.raw import analyze as analyze_raw_metrics
+            from radon.visitors import ComplexityVisitor
+
+            # Equivalent to radon's mi_visit(code, multi=True), but the Halstead and cyclomatic
+            # complexity visitors run on the cached AST instead of radon parsing the code again.
+            # Only the raw line metrics (comments, LLOC) still need radon's own tokenize pass.
+            tree = self._tree(code)
+            raw = analyze_raw_metrics(code)
+            comment_lines = raw.comments + raw.multi
+            comments = comment_lines / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+            maintainability_results = mi_compute(
+                h_visit_ast(tree).total.volume,
+                ComplexityVisitor.from_ast(tree).total_complexity,
+                raw.lloc,
+                comments,
+            )
 
             if isinstance(maintainability_results, list):
                 # Format the output for readability if it's a list of results
@@ -643,88 +1337,178 @@ class CodeReviewSystem:
             logging.error(f"Error analyzing complexity on potentially fixed code: {e}")
             return f"❌ Error analyzing complexity on potentially fixed code: {e}"
 
-    # detect_duplicates remains the same, operating on the provided code string
+    def analyze_complexity_lizard(self, code):
+        """Analyzes the cyclomatic complexity of the code using lizard."""
+        try:
+            # The file name only tells lizard which language reader to use
+            analysis = lizard.analyze_file.analyze_source_code(self.filepath, code)
+            if not analysis.function_list:
+                return f"No functions found to measure (NLOC: {analysis.nloc})."
+            most_complex = max(analysis.function_list, key=lambda function: function.cyclomatic_complexity)
+            return (f"Average Cyclomatic Complexity: {analysis.average_cyclomatic_complexity:.2f} "
+                    f"(NLOC: {analysis.nloc}, highest: {most_complex.name} = {most_complex.cyclomatic_complexity})")
+        except Exception as e:
+            logging.error(f"Error analyzing complexity with lizard: {e}")
+            return f"❌ Error analyzing complexity with lizard: {e}"
+
     def detect_duplicates(self, code):
-        """Detects duplicate code lines using difflib."""
-        # Note: This is a simple line-based check and may not find all duplicates.
-        # More advanced tools like dupfinder or token-based analysis are more comprehensive.
+        """Detects duplicate code lines, plus near-duplicates (pairs above SIMILARITY_THRESHOLD) when fuzzy_duplicates is set."""
+        # Identical lines are counted straight from a hash table, which is all the default mode does.
+        # In fuzzy mode only distinct lines that share an LSH band of their MinHash signature are
+        # compared with SequenceMatcher, instead of every pair.
         try:
-            lines = [line.strip() for line in code.splitlines() if line.strip()]
-            # Reverting to original pairwise check for better (though slower) detection:
-            duplicates = sum(
-                 1 for i in range(len(lines)) for j in range(i + 1, len(lines))
-                 if difflib.SequenceMatcher(None, lines[i], lines[j]).ratio() > SIMILARITY_THRESHOLD
-             )
+            # Strip each line once and drop blank ones while streaming them into the counter
+            counts = collections.Counter(filter(None, map(str.strip, code.splitlines())))
+            # Each pair of identical lines counts once, as in the original pairwise comparison
+            duplicates = sum(c * (c - 1) // 2 for c in counts.values())
+            if not self.fuzzy_duplicates:
+                return duplicates
+            lines = list(counts)
+            for i, j in self._similar_line_pairs(lines):
+                duplicates += counts[lines[i]] * counts[lines[j]]
             return duplicates
         except Exception as e:
             logging.error(f"Error detecting duplicates: {e}")
             return f"❌ Error detecting duplicates: {e}"
 
-    def analyze_security(self):
-        """Analyzes the code for security vulnerabilities using Bandit."""
-        # Note: Bandit is Python-specific and runs on the file path.
+    def _similar_line_pairs(self, lines):
+        """Yields index pairs (i < j) of distinct lines whose similarity ratio exceeds SIMILARITY_THRESHOLD."""
+        buckets = collections.defaultdict(list)
+        for index, signature in enumerate(self._minhash_signatures(lines)):
+            for band in range(MINHASH_BANDS):
+                start = band * MINHASH_ROWS
+                buckets[(band, tuple(signature[start:start + MINHASH_ROWS]))].append(index)
+
+        # A pair can share several bands, so collect pairs in sets before scoring/reporting them
+        similar = set()
+        candidates = set()
+        use_rapidfuzz = self._use_rapidfuzz()
+        for members in buckets.values():
+            if use_rapidfuzz and len(members) >= CDIST_MIN_BUCKET_SIZE:
+                # Score a large bucket as one similarity matrix in RapidFuzz's native (multi-threaded) code
+                group = [lines[index] for index in members]
+                scores = rapidfuzz_process.cdist(group, group, scorer=fuzz.ratio,
+                                                 score_cutoff=SIMILARITY_THRESHOLD * 100, workers=-1)
+                for a, b in zip(*numpy.nonzero(numpy.triu(scores, k=1) > SIMILARITY_THRESHOLD * 100)):
+                    similar.add((members[a], members[b]))
+            else:
+                candidates.update(itertools.combinations(members, 2))
+
+        for i, j in candidates - similar:
+            if self._is_similar(lines[i], lines[j]):
+                similar.add((i, j))
+        yield from similar
+
+    def _use_rapidfuzz(self):
+        """Checks whether near-duplicate lines are scored with RapidFuzz (see fuzzy_scorer)."""
+        # Opt-in only: the Indel ratio can exceed difflib's, so the default count must not depend
+        # on whether RapidFuzz happens to be installed
+        return self.fuzzy_scorer == 'rapidfuzz' and rapidfuzz_available
+
+    def _is_similar(self, first, second):
+        """Checks whether two lines' similarity ratio exceeds SIMILARITY_THRESHOLD."""
+        if self._use_rapidfuzz():
+            cutoff = SIMILARITY_THRESHOLD * 100
+            return fuzz.ratio(first, second, score_cutoff=cutoff) > cutoff
+        matcher = difflib.SequenceMatcher(None, first, second)
+        # The cheap upper bounds reject most candidates before the full ratio() computation
+        return (matcher.real_quick_ratio() > SIMILARITY_THRESHOLD
+                and matcher.quick_ratio() > SIMILARITY_THRESHOLD
+                and matcher.ratio() > SIMILARITY_THRESHOLD)
+
+    def _minhash_signatures(self, lines):
+        """Computes the MinHash signature of each line's character shingles."""
+        shingle_hashes = [self._shingle_hashes(line) for line in lines]
+        if numba_available and len(lines) >= NUMBA_MIN_LINES:
+            # Hand the arithmetic-heavy part to the compiled kernel as flat arrays (hashes + line offsets)
+            import numpy
+            kernel, coefficients_a, coefficients_b = _minhash_kernel()
+            offsets = numpy.cumsum([0] + [len(hashes) for hashes in shingle_hashes], dtype=numpy.int64)
+            flat_hashes = numpy.fromiter(itertools.chain.from_iterable(shingle_hashes),
+                                         dtype=numpy.uint64, count=int(offsets[-1]))
+            signatures = kernel(flat_hashes, offsets, coefficients_a, coefficients_b, numpy.uint64(_MINHASH_PRIME))
+            return signatures.tolist()
+        return [
+            [min([(a * h + b) % _MINHASH_PRIME for h in hashes]) & _MINHASH_VALUE_MASK for a, b in _MINHASH_PERMUTATIONS]
+            for hashes in shingle_hashes
+        ]
+
+    def _shingle_hashes(self, line):
+        """Hashes the distinct character shingles of a line."""
+        # Lines shorter than a shingle are treated as a single shingle
+        shingles = {line[k:k + SHINGLE_SIZE] for k in range(max(1, len(line) - SHINGLE_SIZE + 1))}
+        return [zlib.crc32(shingle.encode(ENCODING)) for shingle in shingles]
+
+    @_cached_tool("bandit")
+    def analyze_security(self, paths=None):
+        """Analyzes the code for security vulnerabilities using Bandit (on several files in one invocation)."""
+        # Note: Bandit is Python-specific and runs on the file path(s).
+        paths = paths or [self.filepath]
         try:
             # -f json outputs results in JSON format
-            # check=True because Bandit's non-zero exit code indicates issues found, not an execution error.
-            # We want to capture the output in this case.
-            result = subprocess.run(
-                ["bandit", self.filepath, "-f", "json"],
-                capture_output=True, text=True, check=True
-            )
+            # Bandit exits with non-zero if issues are found, which is not an execution error,
+            # so the exit code is ignored and the JSON output is used either way.
+            # The report is parsed straight from the output bytes; only a failure message is decoded
+            _, stdout, stderr = self._run_tool(["bandit", *paths, "-f", "json"], decode=False)
             # Load the JSON output
-            security_report = json.loads(result.stdout)
+            security_report = json_loads(stdout)
             return security_report
         except FileNotFoundError:
             logging.error("Bandit is not installed or not in PATH.")
             return "❌ Bandit execution failed: not installed or not in PATH. (Install with: pip install bandit)"
-        except subprocess.CalledProcessError as e:
-             # Bandit exits with non-zero if issues are found. We still want the JSON output.
-             try:
-                 security_report = json.loads(e.stdout)
-                 return security_report
-             except json.JSONDecodeError:
-                 logging.error(f"Bandit execution failed and output is not valid JSON: {e.stdout + e.stderr}")
-                 return f"❌ Bandit execution failed and output is not valid JSON:\n{e.stdout + e.stderr}"
-        except json.JSONDecodeError:
-             logging.error(f"Bandit output is not valid JSON: {result.stdout}")
-             return f"❌ Bandit output is not valid JSON:\n{result.stdout}"
+        except (json.JSONDecodeError, UnicodeDecodeError):
+             output = self._decode_output(stdout + stderr)
+             logging.error(f"Bandit output is not valid JSON: {output}")
+             return f"❌ Bandit output is not valid JSON:\n{output}"
         except Exception as e:
             logging.error(f"Bandit execution failed: {e}")
             return f"❌ Bandit execution failed: {e}"
 
-    def detect_runtime_errors(self):
-        """Detects runtime errors by executing the Python script."""
-        # Note: This is a basic execution and runs on the original file path.
+    def detect_runtime_errors(self, code):
+        """Detects errors by compiling the Python code, or by executing the script when execute is set."""
+        if not self.execute:
+            # Compiling catches syntax errors (and compile-time ones such as 'return' outside a
+            # function) without running arbitrary code or paying for an interpreter start-up.
+            # The tree is shared with the other AST-based analyses of the same code.
+            try:
+                compile(self._tree(code), self.filepath, "exec")
+                return "✅ No syntax errors found (the script was not executed; use --execute to run it)."
+            except SyntaxError as e:
+                return f"{type(e).__name__}: {e.msg} at line {e.lineno}"
+            except Exception as e:
+                logging.error(f"Error compiling script: {e}")
+                return f"❌ Error compiling script: {e}"
+
+        # Note: This is a basic execution and runs on the file path.
         # More complex scenarios require dedicated testing.
         try:
             # Run the script and capture output. timeout prevents infinite execution.
-            result = subprocess.run(
-                ["python", self.filepath],
-                capture_output=True, text=True, timeout=10 # Added a timeout
-            )
+            _, _, stderr = self._run_tool(["python", self.filepath], timeout=10) # Added a timeout
             # If stderr has content, it likely indicates a runtime error.
-            return result.stderr if result.stderr else "✅ No obvious runtime errors found during basic execution."
+            return stderr if stderr else "✅ No obvious runtime errors found during basic execution."
         except FileNotFoundError:
             logging.error(f"Error: Python interpreter not found or file does not exist: {self.filepath}")
             return f"❌ Error: Python interpreter not found or file does not exist: {self.filepath}"
         except subprocess.TimeoutExpired:
              logging.warning(f"Script execution timed out after 10 seconds: {self.filepath}")
-             return f"⚠ Script execution timed out after 10 seconds. Possible infinite loop or long execution time."
+             return "⚠ Script execution timed out after 10 seconds. Possible infinite loop or long execution time."
         except Exception as e:
             logging.error(f"Error executing script: {e}")
             return f"❌ Error executing script: {e}"
 
-    # detect_magic_numbers remains the same, operating on the provided code string
     def detect_magic_numbers(self, code):
         """Detects magic numbers in the Python code using AST."""
         try:
-            tree = ast.parse(code)
-            # Walk the AST and find Constant nodes that are integers or floats, excluding 0 and 1.
-            magic_numbers = [
-                node.value for node in ast.walk(tree)
-                if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and node.value not in (0, 1)
-            ]
-            return len(magic_numbers)
+            # Reuse the cached parse of this source if another check already parsed it
+            tree = self._tree(code)
+            # Walk the AST once and count Constant nodes that are integers or floats, excluding 0 and 1.
+            # Exact type checks skip isinstance's subclass lookup and keep booleans out explicitly;
+            # counting directly avoids building a list of values just to take its length.
+            constant, numeric = ast.Constant, (int, float)
+            return sum(
+                1 for node in ast.walk(tree)
+                if type(node) is constant and type(node.value) in numeric and node.value not in (0, 1)
+            )
         except Exception as e:
             # This catch will now trigger if AST fails to parse the fixed code
             logging.error(f"Error detecting magic numbers on potentially fixed code: {e}")
@@ -733,37 +1517,19 @@ class CodeReviewSystem:
     def suggest_fixes(self, runtime_errors):
         """Suggests fixes for common runtime errors."""
         suggestions = []
-        # Add more specific checks and suggestions based on error messages
+        # Add more specific checks and suggestions based on error messages (see _FIX_SUGGESTIONS)
         if isinstance(runtime_errors, str):
-            if "TypeError" in runtime_errors:
-                suggestions.append("🔹 Fix TypeError: Ensure variables have matching data types or perform explicit type casting.")
-            if "IndexError" in runtime_errors:
-                suggestions.append("🔹 Fix IndexError: Check list/sequence boundaries before accessing elements. Use len() or in operator.")
-            if "ValueError" in runtime_errors:
-                suggestions.append("🔹 Fix ValueError: Validate input values before attempting conversions or operations that expect specific formats.")
-            if "UnicodeEncodeError" in runtime_errors or "UnicodeDecodeError" in runtime_errors:
-                suggestions.append("🔹 Fix Unicode Error: Ensure consistent encoding (e.g., UTF-8) when reading/writing files or handling strings. Check sys.stdout.reconfigure(encoding='utf-8').")
-            if "NameError" in runtime_errors:
-                suggestions.append("🔹 Fix NameError: Ensure all variables and functions are defined and spelled correctly before use. Check variable scope.")
-            if "FileNotFoundError" in runtime_errors:
-                suggestions.append(
-                    f"🔹 Fix FileNotFoundError: Verify the file path is correct and the file exists at: {self.filepath}. Check file permissions."
-                )
-            if "ImportError" in runtime_errors or "ModuleNotFoundError" in runtime_errors:
-                 suggestions.append("🔹 Fix ImportError: Ensure required libraries are installed (pip install library_name) and that import paths are correct.")
-            if "SyntaxError" in runtime_errors:
-                 suggestions.append("🔹 Fix SyntaxError: Review the indicated line for grammatical errors in the code structure (e.g., missing colons, unmatched parentheses).")
-            if "IndentationError" in runtime_errors:
-                 suggestions.append("🔹 Fix IndentationError: Ensure consistent and correct indentation (spaces or tabs, but not both) for code blocks in Python.")
-            if "timed out" in runtime_errors:
-                 suggestions.append("🔹 Address Timeout: The script might be in an infinite loop or performing a very long computation. Review loops and complex algorithms.")
-            if "can't multiply sequence by non-int of type 'float'" in runtime_errors:
-                 suggestions.append("🔹 Fix TypeError: The can't multiply sequence by non-int of type 'float' error usually means you're trying to perform arithmetic with a list or other sequence type and a number. Ensure you are using numeric types where arithmetic is expected.")
+            if _FIX_AUTOMATON is not None:
+                # One pass over the output finds every pattern; report the matches in table order
+                matched = sorted({index for _, index in _FIX_AUTOMATON.iter(runtime_errors)})
+            else:
+                matched = sorted({_FIX_PATTERN_INDEX[match] for match in _FIX_REGEX.findall(runtime_errors)})
+            suggestions.extend(_FIX_SUGGESTIONS[index][1].format(filepath=self.filepath) for index in matched)
         else:
              suggestions.append("🔹 Review the runtime error messages for specific issues.")
 
-        if not suggestions and isinstance(runtime_errors, str) and "No obvious runtime errors found" in runtime_errors:
-             suggestions.append("✅ No specific runtime error suggestions based on basic execution.")
+        if not suggestions and isinstance(runtime_errors, str) and runtime_errors.startswith("✅"):
+             suggestions.append("✅ No specific runtime error suggestions.")
         elif not suggestions and isinstance(runtime_errors, str) and runtime_errors.strip():
              suggestions.append(f"🔹 Review the following runtime output for potential issues:\n{runtime_errors}")
         elif not suggestions:
@@ -786,8 +1552,8 @@ class CodeReviewSystem:
             "fixed_code": self.fixed_code
             }
         try:
-            with open(json_path, "w", encoding=ENCODING) as f:
-                json.dump(report_data, f, indent=4)
+            with open(json_path, "wb") as f:
+                f.write(json_dumps(report_data))
             print(f"📂 *Report Saved:* {json_path}")
         except Exception as e:
             logging.error(f"Error saving report: {e}")
@@ -799,24 +1565,19 @@ class CodeReviewSystem:
             return security_results # Return error message directly
         elif isinstance(security_results, dict) and security_results.get('results'):
             issues = security_results['results']
-            high_severity = sum(1 for issue in issues if issue['severity'] == 'HIGH')
-            medium_severity = sum(1 for issue in issues if issue['severity'] == 'MEDIUM')
-            low_severity = sum(1 for issue in issues if issue['severity'] == 'LOW')
+            # Count every severity level in a single pass over the issues
+            severities = collections.Counter(issue['issue_severity'] for issue in issues)
             total_issues = len(issues)
-            report_str = f"Potential security vulnerabilities detected ({total_issues} total):"
-            if high_severity > 0:
-                report_str += f" High: {high_severity},"
-            if medium_severity > 0:
-                report_str += f" Medium: {medium_severity},"
-            if low_severity > 0:
-                report_str += f" Low: {low_severity}"
-            # Remove trailing comma if any
-            report_str = report_str.rstrip(',') + "."
+            # List only the levels that occur, e.g. " High: 1, Low: 2"
+            counts = ",".join(f" {label}: {severities[level]}"
+                              for level, label in (('HIGH', 'High'), ('MEDIUM', 'Medium'), ('LOW', 'Low'))
+                              if severities[level] > 0)
+            report_str = f"Potential security vulnerabilities detected ({total_issues} total):{counts}."
 
             # Optionally, list the issues
             # report_str += "\nDetails:"
             # for issue in issues:
-            #     report_str += f"\n  - [{issue['severity']}] {issue['test_name']} at {issue['filename']}:{issue['lineno']}: {issue['issue_text']}"
+            #     report_str += f"\n  - [{issue['issue_severity']}] {issue['test_name']} at {issue['filename']}:{issue['lineno']}: {issue['issue_text']}"
 
             return report_str
         else:
@@ -824,8 +1585,22 @@ class CodeReviewSystem:
 
     def generate_performance_graphs(self, results):
         """Generates and saves performance graphs."""
+        # matplotlib (and the NumPy and font cache it loads) is only imported when graphs are drawn.
+        # The non-interactive Agg backend is all savefig needs, and skips loading a GUI toolkit.
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
         base, ext = os.path.splitext(self.filepath)
+        # Both graphs are drawn on one Figure, cleared in between, instead of building a new one each
+        fig, ax = plt.subplots(figsize=(8, 5))
+        try:
+            self._draw_performance_graphs(results, base, fig, ax)
+        finally:
+            plt.close(fig) # Close the plot to free memory
 
+    def _draw_performance_graphs(self, results, base, fig, ax):
+        """Draws the time and RAM usage graphs on one Figure and saves each as a PNG."""
         # --- Time Metrics Graph ---
         time_labels = ['Analysis and Fixing', 'Report Generation']
         time_values = [
@@ -835,12 +1610,11 @@ class CodeReviewSystem:
 
         # Filter out N/A if any. Assuming if one time is N/A, they all might be.
         if all(isinstance(t, (int, float)) for t in time_values):
-            plt.figure(figsize=(8, 5))
-            plt.bar(time_labels, time_values, color=['blue', 'green'])
-            plt.ylabel('Time (seconds)')
-            plt.title('Code Review Performance - Time')
-            plt.savefig(f"{base}_time_performance.png")
-            plt.close() # Close the plot to free memory
+            ax.bar(time_labels, time_values, color=['blue', 'green'])
+            ax.set_ylabel('Time (seconds)')
+            ax.set_title('Code Review Performance - Time')
+            fig.savefig(f"{base}_time_performance.png")
+            ax.clear() # Reuse the axes for the next graph
             print(f"📊 *Time performance graph saved:* {base}_time_performance.png")
         else:
             print("⚠ Cannot generate time performance graph: time data not available.")
@@ -851,16 +1625,16 @@ class CodeReviewSystem:
         ram_labels = []
         ram_values = [] # Storing in bytes initially
 
-        # Find the RAM usage keys that have numerical values
-        ram_analysis_fix_key = next((k for k in results if k.startswith('ram_usage_analysis_fix') and isinstance(results[k], (int, float))), None)
-        ram_report_generation_key = next((k for k in results if k.startswith('ram_usage_report_generation') and isinstance(results[k], (int, float))), None)
+        # Use the RAM usage samples that have numerical values
+        ram_analysis_fix = results.get('ram_usage_analysis_fix')
+        ram_report_generation = results.get('ram_usage_report_generation')
 
-        if ram_analysis_fix_key:
+        if isinstance(ram_analysis_fix, (int, float)):
              ram_labels.append('Peak RAM (Analysis/Fixing)')
-             ram_values.append(results[ram_analysis_fix_key])
-        if ram_report_generation_key:
+             ram_values.append(ram_analysis_fix)
+        if isinstance(ram_report_generation, (int, float)):
              ram_labels.append('Peak RAM (Report Generation)')
-             ram_values.append(results[ram_report_generation_key])
+             ram_values.append(ram_report_generation)
 
         # Generate graph only if we have numerical RAM data
         if ram_values:
@@ -881,16 +1655,14 @@ class CodeReviewSystem:
                  unit = "Unknown Unit"
 
 
-            plt.figure(figsize=(8, 5))
-            plt.bar(ram_labels, ram_values_mb, color=['purple', 'orange'])
-            plt.ylabel(f'RAM Usage ({unit})')
-            plt.title('Code Review Performance - RAM Usage')
+            ax.bar(ram_labels, ram_values_mb, color=['purple', 'orange'])
+            ax.set_ylabel(f'RAM Usage ({unit})')
+            ax.set_title('Code Review Performance - RAM Usage')
             # Add the exact MB value on top of each bar
             for i, v in enumerate(ram_values_mb):
-                plt.text(i, v + (max(ram_values_mb)*0.02 if ram_values_mb else 0.02) , f"{v:.2f} MB", ha='center')
+                ax.text(i, v + (max(ram_values_mb)*0.02 if ram_values_mb else 0.02) , f"{v:.2f} MB", ha='center')
 
-            plt.savefig(f"{base}_ram_performance.png")
-            plt.close() # Close the plot to free memory
+            fig.savefig(f"{base}_ram_performance.png")
             print(f"📊 *RAM usage graph saved:* {base}_ram_performance.png")
         else:
             print("⚠ Cannot generate RAM usage graph: numerical RAM data not available.")
@@ -907,17 +1679,17 @@ class CodeReviewSystem:
             fixed_complexity = results.get('complexity_fixed', 'N/A - Analysis failed.')
 
             if self.fixed_code and self.original_code != self.fixed_code:
-                 print(f"⿡ Code Complexity (Maintainability Index):")
+                 print("⿡ Code Complexity:")
                  print(f"   - Original: {original_complexity}")
                  print(f"   - After Formatting: {fixed_complexity}")
             else:
-                 print(f"⿡ Code Complexity (Maintainability Index): {original_complexity}")
+                 print(f"⿡ Code Complexity: {original_complexity}")
 
 
             print(f"⿢ Duplicates (Lines): {results.get('duplicates', 'N/A - Analysis failed.')}")
             print(f"⿣ Security Issues (Bandit): {self.format_security_report_readable(results.get('security', 'N/A'))}")
-            # Runtime errors are still reported from the original file run
-            print(f"⿤ Runtime Errors (Basic Execution): {results.get('runtime_errors', 'N/A')}")
+            runtime_check = "Basic Execution" if self.execute else "Syntax Check"
+            print(f"⿤ Runtime Errors ({runtime_check}): {results.get('runtime_errors', 'N/A')}")
             # Magic numbers are now detected on the potentially fixed code
             print(f"⿥ Magic Numbers Found: {results.get('magic_numbers', 'N/A - Analysis failed.')}")
             print(f"⿦ Type Checking (MyPy): \n{results.get('mypy', 'N/A')}")
@@ -961,12 +1733,8 @@ class CodeReviewSystem:
              print(f"   - Time for Report Generation: {time_report_generation}")
 
         # Format RAM usage metrics based on which module was used
-        # Access the values using the keys that include the module name
-        ram_analysis_fix_key = next((k for k in results if k.startswith('ram_usage_analysis_fix')), None)
-        ram_report_generation_key = next((k for k in results if k.startswith('ram_usage_report_generation')), None)
-
-        ram_analysis_fix = results.get(ram_analysis_fix_key, 'N/A') if ram_analysis_fix_key else 'N/A (Data key not found)'
-        ram_report_generation = results.get(ram_report_generation_key, 'N/A') if ram_report_generation_key else 'N/A (Data key not found)'
+        ram_analysis_fix = results.get('ram_usage_analysis_fix', 'N/A (Data key not found)')
+        ram_report_generation = results.get('ram_usage_report_generation', 'N/A (Data key not found)')
 
 
         print("   - Peak RAM Usage (Analysis/Fixing): ", end="")
@@ -1001,9 +1769,10 @@ class CodeReviewSystem:
         # Print code modifications (diff) and fixed code if available
         if self.original_code and self.fixed_code and self.original_code != self.fixed_code:
             print("\n📝 *Code Modifications (Diff):*")
-            # Generate and print the diff between original and fixed code
-            differ = difflib.Differ()
-            diff = differ.compare(self.original_code.splitlines(), self.fixed_code.splitlines())
+            # Generate and print a unified diff between original and fixed code. Unlike Differ.compare,
+            # it only reports changed hunks with a few lines of context, and is much faster on large files.
+            diff = difflib.unified_diff(self.original_code.splitlines(), self.fixed_code.splitlines(),
+                                        lineterm='', n=3)
             print('\n'.join(diff))
 
             print("\n✨ *Formatted/Fixed Code:*")
@@ -1023,12 +1792,101 @@ class CodeReviewSystem:
         print("\n🎯 *Code review completed.*\n")
 
 
-if _name_ == "_main_":
-    # Argument parsing for the file path
+def review_files(filepaths, **options):
+    """
+    Reviews several files, invoking each batch-capable tool once per language.
+
+    Args:
+        filepaths (list): Paths of the files to review.
+        **options: Keyword arguments passed on to every CodeReviewSystem.
+    """
+    # Review each file once, however many paths (e.g. overlapping globs) name it: batched tool
+    # output is matched to the files by normalized path, so each file needs a single spelling
+    unique = {}
+    for filepath in filepaths:
+        unique.setdefault(_normalized_path(filepath), filepath)
+    review_systems = [CodeReviewSystem(filepath, **options) for filepath in unique.values()]
+
+    # Group the files by language so each tool is started once for the whole group
+    groups = collections.defaultdict(list)
+    for review_system in review_systems:
+        groups[review_system.detect_language(review_system.filepath)].append(review_system)
+
+    for language, members in groups.items():
+        if len(members) < 2:
+            continue
+        # Keep the original code before the batched formatters rewrite the files in place
+        for review_system in members:
+            review_system.original_code = review_system._read()
+        batch = members[0].run_batch(language, [review_system.filepath for review_system in members])
+        for review_system in members:
+            review_system.batch_results = batch[review_system.filepath]
+
+    if len(review_systems) == 1:
+        review_systems[0].run_review()
+        return
+
+    # Review the files in parallel worker processes; each worker captures its file's console
+    # output so the summaries are printed here whole and in order instead of interleaved.
+    # (no more workers than files: each one is a forked copy of this process that has to be started)
+    processes = min(len(review_systems), os.cpu_count() or 1)
+    chunksize = max(1, len(review_systems) // (4 * processes))
+    with multiprocessing.Pool(processes=processes) as pool:
+        for output in pool.imap(_review_one, review_systems, chunksize=chunksize):
+            print(output, end="")
+
+
+def _review_one(review_system):
+    """Runs one review in a worker process and returns its console output."""
+    # The JSON report and graphs are written by the worker itself; only the text crosses the pipe
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        review_system.run_review()
+    return output.getvalue()
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments. Defaults to sys.argv[1:].
+    """
+    # Argument parsing for the file paths
     parser = argparse.ArgumentParser(description="Automated Code Review System")
-    parser.add_argument("filepath", help="Path to the file to review")
-    args = parser.parse_args()
-
-    # Create and run the review system
-    review_system = CodeReviewSystem(args.filepath)
-    review_system.run_review()
+    parser.add_argument("filepaths", nargs="+", help="Path(s) or glob pattern(s) of the file(s) to review")
+    parser.add_argument("--complexity-backend", choices=["lizard", "radon"], default="lizard",
+                        help="Complexity metric: lizard cyclomatic complexity (default, falls back to radon "
+                             "when lizard is not installed) or radon Maintainability Index")
+    parser.add_argument("--fuzzy-duplicates", action="store_true",
+                        help="Also count near-duplicate lines (slower; exact duplicates only by default)")
+    parser.add_argument("--fuzzy-scorer", choices=["difflib", "rapidfuzz"], default="difflib",
+                        help="Similarity ratio for --fuzzy-duplicates: difflib SequenceMatcher (default) or "
+                             "RapidFuzz's faster Indel ratio, which is never lower and so can count more "
+                             "near-duplicates (falls back to difflib when RapidFuzz is not installed)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always re-run Flake8 and Bandit instead of reusing their "
+                             f"cached output for unchanged files (cache: {TOOL_CACHE_DIR})")
+    parser.add_argument("--execute", action="store_true",
+                        help="Run Python files (10 s timeout) to detect runtime errors; by default they "
+                             "are only compiled to check for syntax errors")
+    parser.add_argument("--no-phase-memory-sample", action="store_true",
+                        help="Skip the RAM sample taken between the analysis and report phases, "
+                             "so it does not add to the measured analysis time")
+    parser.add_argument("--no-graphs", action="store_true",
+                        help="Do not save the time and RAM usage graphs (skips importing matplotlib)")
+    args = parser.parse_args(argv)
+
+    # Expand glob patterns here as well, for shells that pass them through unexpanded (e.g. cmd.exe)
+    filepaths = []
+    for pattern in args.filepaths:
+        filepaths.extend(sorted(glob.glob(pattern, recursive=True)) or [pattern])
+
+    # Create and run the review system for every file
+    review_files(filepaths, complexity_backend=args.complexity_backend, fuzzy_duplicates=args.fuzzy_duplicates,
+                 fuzzy_scorer=args.fuzzy_scorer, use_cache=not args.no_cache, execute=args.execute,
+                 sample_memory_between_phases=not args.no_phase_memory_sample, graphs=not args.no_graphs)
+
+
+if __name__ == "__main__":
+    main()